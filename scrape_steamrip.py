@@ -15,33 +15,64 @@ Behavior:
     - All.Games.json is updated from the DB (sorted by Name)
     - New.Games.json is updated by prepending the truly-new entries for this run (so newest appear first),
       preserving any existing entries in New.Games.json afterwards.
+- The list page is first fetched with a plain HTTP request; Chrome is only started when that yields no games
+  (request failed or the page is gated behind a JS challenge).
 - The script attempts to auto-install needed pip packages and to shim distutils via setuptools where possible
   to avoid "No module named 'distutils'" when importing undetected_chromedriver on modern Pythons.
 - The script prints full tracebacks on error and waits for Enter before exiting so console windows remain open.
 
 Usage:
     python steamrip_scrape_db.py
+    python steamrip_scrape_db.py --daemon [--interval MINUTES]   # keep one browser alive and re-scrape on a timer
+
+Set STEAMRIP_CHROME_DEBUGGER=host:port to attach to a running Chrome instead of launching a new one.
 """
 from __future__ import annotations
 
 import sys
 import os
+import argparse
 import subprocess
 import importlib
+import importlib.util
 import traceback
 import re
 import json
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from html import unescape
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional, Set, Union
 import tempfile
+import time
+import urllib.error
+import urllib.request
+from urllib.parse import urljoin
+
+try:
+    import orjson  # optional: C-backed JSON encoder, stdlib json is used when missing
+except ImportError:
+    orjson = None
 
 # Configuration
 URL = "https://steamrip.com/games-list-page/"
+# games.slug stores Urls with this prefix stripped; anything not under it is stored as the full Url
+SITE_PREFIX = "https://steamrip.com/"
 DB_FILENAME = "steamrip_games.db"
 JSON_ALL = "All.Games.json"
 JSON_NEW = "New.Games.json"
+# host:port of an already running Chrome (started with --remote-debugging-port) to attach to instead of launching one
+CHROME_DEBUGGER_ENV = "STEAMRIP_CHROME_DEBUGGER"
+DEFAULT_DAEMON_INTERVAL_MINUTES = 60
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en",
+}
 
 # mapping import_name -> pip package name
 PACKAGE_MAP: Dict[str, str] = {
@@ -61,13 +92,28 @@ def run_pip_install(packages: List[str]) -> None:
     subprocess.check_call(cmd)
 
 
+def is_installed(import_name: str) -> bool:
+    # presence check only: locating the module is far cheaper than importing it
+    try:
+        return importlib.util.find_spec(import_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def import_error(import_name: str) -> Optional[Exception]:
+    try:
+        importlib.import_module(import_name)
+    except Exception as ex:
+        return ex
+    return None
+
+
 def try_install_and_verify(map_import_to_pip: Dict[str, str]) -> None:
     missing_pips: List[str] = []
     missing_imports: List[str] = []
+    # find_spec probes take microseconds each; a thread pool would cost more to start than it saves
     for import_name, pip_name in map_import_to_pip.items():
-        try:
-            importlib.import_module(import_name)
-        except Exception:
+        if not is_installed(import_name):
             missing_imports.append(import_name)
             if pip_name not in missing_pips:
                 missing_pips.append(pip_name)
@@ -82,12 +128,14 @@ def try_install_and_verify(map_import_to_pip: Dict[str, str]) -> None:
                 print(f"  {sys.executable} -m pip install --upgrade {p}")
 
     # re-check imports and show any remaining problems
-    still_missing = []
-    for import_name in missing_imports:
-        try:
-            importlib.import_module(import_name)
-        except Exception as ex:
-            still_missing.append((import_name, ex))
+    importlib.invalidate_caches()
+    if len(missing_imports) > 1:
+        # real imports execute module code and can take much longer, so these are worth overlapping
+        with ThreadPoolExecutor(max_workers=len(missing_imports)) as ex:
+            errors = list(ex.map(import_error, missing_imports))
+    else:
+        errors = [import_error(name) for name in missing_imports]
+    still_missing = [(name, err) for name, err in zip(missing_imports, errors) if err is not None]
     if still_missing:
         print("Warning: Some imports still unavailable after attempted install:")
         for name, ex in still_missing:
@@ -138,46 +186,129 @@ def ensure_distutils_shim() -> None:
 
 
 # -------------------- Scraping helpers (v3 logic) -------------------- #
+_RE_FREE = re.compile(r"\s*free\s+download.*$", re.I)
+_RE_PAREN = re.compile(r"\s*\(.*?\)\s*$")
+_RE_WS = re.compile(r"\s+")
+_RE_SLUG_SUFFIX = re.compile(r"-free-download$", re.I)
+# every anchor whose href contains '-free-download'; collect_games then keeps only on-site links, so the
+# browser and the HTTP parsers select the same set whether an href is relative or absolute
+ANCHOR_SELECTOR = 'a[href*="-free-download"]'
+_RE_ANCHOR = re.compile(r'<a\s+[^>]*href=["\']([^"\']*-free-download[^"\']*)["\'][^>]*>(.*?)</a>', re.I | re.S)
+
+
 def clean_name(raw_text: str) -> str:
     if not raw_text:
         return ""
     text = raw_text.strip()
-    text = re.sub(r"\s*free\s+download.*$", "", text, flags=re.I).strip()
-    text = re.sub(r"\s*\(.*?\)\s*$", "", text).strip()
-    text = re.sub(r"\s+", " ", text).strip(' -–+,:')
-    return unescape(text)
+    text = _RE_FREE.sub("", text).strip()
+    text = _RE_PAREN.sub("", text).strip()
+    return _RE_WS.sub(" ", text).strip(' -–+,:')
 
 
-def extract_games_from_html(html: str) -> List[Dict[str, str]]:
+def anchor_pairs_selectolax(html: str) -> List[Tuple[str, str]]:
     """
-    Extract anchors with '-free-download' in href; return list of {"Name","Url"}.
-    This function mirrors the anchor-finding regex behavior used earlier.
+    (href, text) pairs via selectolax's lexbor parser; raises ImportError when selectolax is not installed.
+    """
+    try:
+        from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    except ImportError:
+        from selectolax.parser import HTMLParser  # selectolax < 1.0
+    return [
+        (a.attributes.get("href") or "", a.text() or "")
+        for a in HTMLParser(html).css(ANCHOR_SELECTOR)
+    ]
+
+
+def anchor_pairs_lxml(html: str) -> List[Tuple[str, str]]:
+    """
+    (href, text) pairs via lxml; raises ImportError when lxml is not installed and parser errors
+    for documents it rejects (empty, encoding declaration, ...).
     """
-    pattern = r'<a\s+[^>]*href=["\']([^"\']*-free-download[^"\']*)["\'][^>]*>(.*?)</a>'
-    results = []
-    seen = set()
-    for m in re.finditer(pattern, html, flags=re.I | re.S):
-        raw_href = m.group(1).strip()
-        raw_text = m.group(2).strip()
+    from lxml import html as lxml_html
+    doc = lxml_html.fromstring(html)
+    xpath = '//a[contains(@href, "-free-download")]'
+    return [(a.get("href") or "", a.text_content() or "") for a in doc.xpath(xpath)]
+
+
+def anchor_pairs_regex(html: str) -> List[Tuple[str, str]]:
+    # the regex sees raw markup, so entities are decoded here; the parsers above already return decoded text
+    return [(m.group(1), unescape(m.group(2))) for m in _RE_ANCHOR.finditer(html)]
+
+
+def iter_anchor_pairs(html: str) -> List[Tuple[str, str]]:
+    """
+    Return (href, text) for every anchor whose href contains '-free-download'.
+    Uses selectolax (lexbor) or lxml when installed so parsing runs in native code;
+    falls back to the anchor regex otherwise.
+    """
+    try:
+        return anchor_pairs_selectolax(html)
+    except ImportError:
+        pass
+    try:
+        return anchor_pairs_lxml(html)
+    except Exception:
+        pass  # lxml missing, or it rejected the document
+    return anchor_pairs_regex(html)
+
+
+def collect_games(pairs: Iterable[Tuple[str, str]]) -> List[Dict[str, str]]:
+    """
+    Turn (href, text) anchor pairs into unique {"Name","Url"} entries in first-seen order.
+    Only on-site game links are kept, relative or absolute, so the browser and HTTP paths yield the same
+    snapshot. Duplicate Urls are dropped before any name cleaning is done for them.
+    """
+    seen: Dict[str, str] = {}  # Url -> Name
+    for raw_href, text in pairs:
+        raw_href = (raw_href or "").strip()
         if not raw_href:
             continue
-        if raw_href.startswith("/"):
-            href = "https://steamrip.com" + raw_href.lstrip("/")
-        else:
-            href = raw_href
+        href = raw_href if raw_href.startswith(("https://", "http://")) else urljoin(URL, raw_href)
         href = href.rstrip("/")
-        name = clean_name(raw_text)
-        if not name:
-            slug = href.rstrip("/").split("/")[-1]
-            slug_name = re.sub(r'-free-download$', '', slug, flags=re.I)
-            name = slug_name.replace("-", " ").strip()
-        if not name or not href:
-            continue
-        if href in seen:
+        if not href.startswith(SITE_PREFIX) or "-free-download" not in href or href in seen:
             continue
-        seen.add(href)
-        results.append({"Name": name, "Url": href})
-    return results
+        name = clean_name(text or "")
+        if not name:
+            slug = href.split("/")[-1]
+            name = _RE_SLUG_SUFFIX.sub('', slug).replace("-", " ").strip()
+        if name:
+            seen[href] = name
+    return [{"Name": name, "Url": url} for url, name in seen.items()]
+
+
+def extract_games_from_html(html: str) -> List[Dict[str, str]]:
+    """
+    Extract anchors with '-free-download' in href; return list of {"Name","Url"}.
+    """
+    return collect_games(iter_anchor_pairs(html))
+
+
+def scrape_http(url: str = URL, timeout: float = 20) -> List[Dict[str, str]]:
+    """
+    Fetch the list page with a plain HTTP request and parse it without a browser.
+    Returns [] if the request fails or the page carries no game anchors (e.g. a JS challenge),
+    so the caller can fall back to a real browser.
+    """
+    req = urllib.request.Request(url, headers=HTTP_HEADERS)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            charset = resp.headers.get_content_charset() or "utf-8"
+            body = resp.read()
+    except (urllib.error.URLError, OSError, ValueError) as e:
+        print(f"Direct HTTP fetch of {url} failed: {e}")
+        return []
+    try:
+        html = body.decode(charset, errors="replace")
+    except LookupError:  # the server named a charset Python doesn't know
+        html = body.decode("utf-8", errors="replace")
+    return extract_games_from_html(html)
+
+
+# [resolved href (or data-href), rendered text] for every anchor matching the selector in arguments[0]
+ANCHOR_PAIRS_JS = (
+    "return Array.from(document.querySelectorAll(arguments[0]), "
+    "a => [a.href || a.getAttribute('data-href') || '', a.innerText || a.textContent || '']);"
+)
 
 
 def scrape(driver) -> List[Dict[str, str]]:
@@ -188,35 +319,13 @@ def scrape(driver) -> List[Dict[str, str]]:
     driver.get(URL)
     wait = WebDriverWait(driver, 15)
     try:
-        wait.until(EC.presence_of_element_located(
-            (By.XPATH, "//a[contains(@href,'-free-download') and starts-with(@href,'/')]")
-        ))
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ANCHOR_SELECTOR)))
     except Exception:
         pass
 
-    anchors = driver.find_elements(By.XPATH, "//a[contains(@href,'-free-download') and starts-with(@href,'/')]")
-    results = []
-    seen = set()
-    for a in anchors:
-        href = a.get_attribute("href") or a.get_attribute("data-href") or ""
-        if href and href.startswith("/"):
-            href = "https://steamrip.com" + href.lstrip("/")
-        href = href.rstrip("/")
-        text = a.text or a.get_attribute("innerText") or ""
-        name = clean_name(text)
-        if not name:
-            slug = a.get_attribute("href") or a.get_attribute("data-href") or ""
-            if slug:
-                slug = slug.rstrip("/").split("/")[-1]
-                name = re.sub(r'-free-download$', '', slug, flags=re.I)
-                name = name.replace("-", " ").strip()
-        if not name or not href:
-            continue
-        if href in seen:
-            continue
-        seen.add(href)
-        results.append({"Name": name.strip(), "Url": href})
-    return results
+    # one round-trip for all anchors instead of several WebDriver calls per element
+    pairs = driver.execute_script(ANCHOR_PAIRS_JS, ANCHOR_SELECTOR) or []
+    return collect_games(pairs)
 
 
 # -------------------- Database helpers (v3 schema/behavior) -------------------- #
@@ -229,6 +338,10 @@ def get_script_dir() -> str:
 
 
 SCRIPT_DIR = get_script_dir()
+DB_PATH = os.path.join(SCRIPT_DIR, DB_FILENAME)
+FALLBACK_DB_PATH = os.path.join(os.path.expanduser("~"), DB_FILENAME)
+JSON_ALL_PATH = os.path.join(SCRIPT_DIR, JSON_ALL)
+JSON_NEW_PATH = os.path.join(SCRIPT_DIR, JSON_NEW)
 
 
 # -------------------- First Run Detection -------------------- #
@@ -236,201 +349,305 @@ SCRIPT_DIR = get_script_dir()
 # This is separate from database first-run detection which tracks game data.
 MARKER_FILENAME = 'first_run_success'
 REQUIREMENTS_FILENAME = 'requirements.txt'
+MARKER_PATH = os.path.join(SCRIPT_DIR, MARKER_FILENAME)
+REQUIREMENTS_PATH = os.path.join(SCRIPT_DIR, REQUIREMENTS_FILENAME)
 
 def is_first_run():
     """Check if this is the first run (requirements not yet installed)."""
-    marker_path = os.path.join(SCRIPT_DIR, MARKER_FILENAME)
-    return not os.path.exists(marker_path)
+    return not os.path.exists(MARKER_PATH)
 
 def mark_first_run_complete():
     """Mark that first-run requirements installation has been completed."""
-    marker_path = os.path.join(SCRIPT_DIR, MARKER_FILENAME)
-    with open(marker_path, 'w') as f:
+    with open(MARKER_PATH, 'w') as f:
         f.write('This file indicates that the first run tasks have been completed.')
 
 def install_requirements():
     """Install packages from requirements.txt on first run."""
-    requirements_path = os.path.join(SCRIPT_DIR, REQUIREMENTS_FILENAME)
-    if not os.path.exists(requirements_path):
-        print(f"Warning: {requirements_path} not found. Skipping requirements installation.")
+    if not os.path.exists(REQUIREMENTS_PATH):
+        print(f"Warning: {REQUIREMENTS_PATH} not found. Skipping requirements installation.")
         return
     
     try:
-        print(f"First run detected. Installing requirements from {requirements_path}...")
-        cmd = [sys.executable, "-m", "pip", "install", "-r", requirements_path]
+        print(f"First run detected. Installing requirements from {REQUIREMENTS_PATH}...")
+        cmd = [sys.executable, "-m", "pip", "install", "-r", REQUIREMENTS_PATH]
         print("Running:", " ".join(cmd))
         subprocess.check_call(cmd)
         print("Requirements installed successfully.")
     except subprocess.CalledProcessError as e:
         print(f"Failed to install requirements: {e}")
         print("Please run the following manually:")
-        print(f"  {sys.executable} -m pip install -r {requirements_path}")
+        print(f"  {sys.executable} -m pip install -r {REQUIREMENTS_PATH}")
         raise
 
 
-def default_db_path(filename: str) -> str:
-    return os.path.join(SCRIPT_DIR, filename)
-
-
-def fallback_db_path(filename: str) -> str:
-    return os.path.join(os.path.expanduser("~"), filename)
-
-
 def connect_db(path: Optional[str] = None) -> sqlite3.Connection:
     if path is None:
-        path = default_db_path(DB_FILENAME)
+        path = DB_PATH
     try:
-        conn = sqlite3.connect(path)
-        conn.row_factory = sqlite3.Row
-        init_db(conn)
-        return conn
+        return open_db(path)
     except sqlite3.OperationalError as e:
         print(f"Failed to open DB at {path}: {e}")
-        fb = fallback_db_path(DB_FILENAME)
+        fb = FALLBACK_DB_PATH
         print(f"Attempting fallback DB at: {fb}")
-        conn = sqlite3.connect(fb)
-        conn.row_factory = sqlite3.Row
-        init_db(conn)
-        return conn
+        return open_db(fb)
 
 
-def init_db(conn: sqlite3.Connection) -> None:
+@contextmanager
+def transaction(conn: sqlite3.Connection, mode: str = "IMMEDIATE") -> Iterator[None]:
+    """
+    Run the block in one explicit transaction: committed on success, rolled back on any error.
+    IMMEDIATE takes the write lock up front so a concurrent writer fails fast instead of mid-batch.
+    """
+    conn.execute(f"BEGIN {mode}")
+    try:
+        yield
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+def open_db(path: str) -> sqlite3.Connection:
+    # autocommit mode: sqlite3 never opens transactions implicitly, all batching goes through transaction()
+    conn = sqlite3.connect(path, isolation_level=None, cached_statements=256)
+    conn.row_factory = sqlite3.Row
+    configure_db(conn)
+    init_db(conn)
+    return conn
+
+
+def configure_db(conn: sqlite3.Connection) -> None:
+    """
+    WAL + synchronous=NORMAL: commits append to the WAL without a full fsync of the main DB file,
+    while still surviving application crashes. The larger page cache keeps the Url index in memory.
+    """
     cur = conn.cursor()
-    cur.execute("""
-    CREATE TABLE IF NOT EXISTS runs (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        run_at TEXT NOT NULL,
-        snapshot_count INTEGER NOT NULL
-    )""")
-    cur.execute("""
-    CREATE TABLE IF NOT EXISTS run_games (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        run_id INTEGER NOT NULL,
-        Name TEXT,
-        Url TEXT,
-        is_new INTEGER NOT NULL DEFAULT 0,
-        FOREIGN KEY(run_id) REFERENCES runs(id)
-    )""")
-    cur.execute("""
-    CREATE TABLE IF NOT EXISTS games (
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.execute("PRAGMA cache_size=-20000")  # ~20 MB
+    cur.execute("PRAGMA mmap_size=268435456")  # 256 MB
+
+
+GAMES_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         Name TEXT,
-        Url TEXT UNIQUE,
+        slug TEXT UNIQUE,
         first_seen TEXT,
         last_seen TEXT
-    )""")
-    conn.commit()
+    )"""
 
 
-def get_games_count(conn: sqlite3.Connection) -> int:
-    cur = conn.cursor()
-    cur.execute("SELECT COUNT(*) FROM games")
-    return cur.fetchone()[0]
+def url_to_slug(url: str) -> str:
+    return url[len(SITE_PREFIX):] if url.startswith(SITE_PREFIX) else url
 
 
-def create_run(conn: sqlite3.Connection, run_at: str, snapshot_count: int) -> int:
-    cur = conn.cursor()
-    cur.execute("INSERT INTO runs(run_at, snapshot_count) VALUES (?, ?)", (run_at, snapshot_count))
-    conn.commit()
-    return cur.lastrowid
+def slug_to_url(slug: str) -> str:
+    return slug if "://" in slug else SITE_PREFIX + slug
 
 
-def insert_run_game(conn: sqlite3.Connection, run_id: int, name: str, url: str, is_new: bool) -> None:
+def migrate_games_url_to_slug(conn: sqlite3.Connection) -> None:
+    """
+    Rebuild a games table from the old schema (full Url UNIQUE) into the slug schema.
+    The table is copied rather than given an extra column so the wide Url index is dropped with it.
+    Runs inside the caller's transaction (see init_db).
+    """
     cur = conn.cursor()
+    columns = {r[1] for r in cur.execute("PRAGMA table_info(games)")}
+    if "Url" not in columns:
+        return
+    print("Migrating games table to slug storage...")
+    cur.execute(GAMES_TABLE_SQL.format(table="games_slug"))
     cur.execute(
-        "INSERT INTO run_games(run_id, Name, Url, is_new) VALUES (?, ?, ?, ?)",
-        (run_id, name, url, 1 if is_new else 0),
+        "INSERT INTO games_slug(id, Name, slug, first_seen, last_seen) "
+        "SELECT id, Name, CASE WHEN substr(Url, 1, ?) = ? THEN substr(Url, ?) ELSE Url END, first_seen, last_seen "
+        "FROM games",
+        (len(SITE_PREFIX), SITE_PREFIX, len(SITE_PREFIX) + 1),
     )
+    cur.execute("DROP TABLE games")
+    cur.execute("ALTER TABLE games_slug RENAME TO games")
 
 
-def insert_game(conn: sqlite3.Connection, name: str, url: str, seen_at: str) -> None:
+def init_db(conn: sqlite3.Connection) -> None:
     cur = conn.cursor()
-    cur.execute(
-        "INSERT OR IGNORE INTO games(Name, Url, first_seen, last_seen) VALUES (?, ?, ?, ?)",
-        (name, url, seen_at, seen_at),
+    with transaction(conn):
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_at TEXT NOT NULL,
+            snapshot_count INTEGER NOT NULL
+        )""")
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS run_games (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id INTEGER NOT NULL,
+            Name TEXT,
+            Url TEXT,
+            is_new INTEGER NOT NULL DEFAULT 0,
+            FOREIGN KEY(run_id) REFERENCES runs(id)
+        )""")
+        cur.execute(GAMES_TABLE_SQL.format(table="games"))
+        migrate_games_url_to_slug(conn)
+        # lets save_all_games_from_db stream games in Name order without a sort step
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_games_lname ON games(lower(Name))")
+
+
+# DB helpers accept a connection or a cursor; run_persist passes one shared cursor for the whole run
+SQLExecutor = Union[sqlite3.Connection, sqlite3.Cursor]
+
+
+def get_games_count(db: SQLExecutor) -> int:
+    return db.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+
+def create_run(db: SQLExecutor, run_at: str, snapshot_count: int) -> int:
+    return db.execute("INSERT INTO runs(run_at, snapshot_count) VALUES (?, ?)", (run_at, snapshot_count)).lastrowid
+
+
+def insert_run_games(db: SQLExecutor, rows: List[Tuple[int, str, str, int]]) -> None:
+    db.executemany("INSERT INTO run_games(run_id, Name, Url, is_new) VALUES (?, ?, ?, ?)", rows)
+
+
+def upsert_games(db: SQLExecutor, rows: List[Tuple[str, str, str, str]]) -> None:
+    """
+    Insert (Name, slug, first_seen, last_seen) rows; for slugs already present only last_seen is bumped.
+    """
+    db.executemany(
+        "INSERT INTO games(Name, slug, first_seen, last_seen) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT(slug) DO UPDATE SET last_seen = excluded.last_seen",
+        rows,
     )
-    cur.execute("UPDATE games SET last_seen = ? WHERE Url = ?", (seen_at, url))
 
 
-def update_game_last_seen(conn: sqlite3.Connection, url: str, seen_at: str) -> None:
-    cur = conn.cursor()
-    cur.execute("UPDATE games SET last_seen = ? WHERE Url = ?", (seen_at, url))
+def get_max_game_id(db: SQLExecutor) -> int:
+    return db.execute("SELECT COALESCE(MAX(id), 0) FROM games").fetchone()[0]
+
+
+def slugs_added_after(db: SQLExecutor, last_id: int) -> Set[str]:
+    """
+    Return the slugs of games rows with id > last_id. With last_id read just before upsert_games this is
+    exactly the set of slugs that were new to the table: AUTOINCREMENT ids only grow and the UPSERT keeps
+    the existing id on conflict. The lookup is a rowid range scan rather than a full table scan.
+    """
+    return {r[0] for r in db.execute("SELECT slug FROM games WHERE id > ?", (last_id,))}
 
 
 def run_persist(conn: sqlite3.Connection, results: List[Dict[str, str]]) -> Tuple[bool, List[Dict[str, str]]]:
     run_at = datetime.now(timezone.utc).isoformat()
-    pre_count = get_games_count(conn)
-    run_id = create_run(conn, run_at, len(results))
-
+    cur = conn.cursor()
     new_entries: List[Dict[str, str]] = []
-    first_run = (pre_count == 0)
 
+    games_rows: List[Tuple[str, str, str, str]] = []
     for g in results:
-        name = g.get("Name")
         url = (g.get("Url") or "").rstrip("/")
-        if not url:
-            continue
+        if url:
+            games_rows.append((g.get("Name"), url_to_slug(url), run_at, run_at))
 
-        cur = conn.cursor()
-        cur.execute("SELECT id FROM games WHERE Url = ?", (url,))
-        existing = cur.fetchone()
-        if existing:
-            update_game_last_seen(conn, url, run_at)
-            insert_run_game(conn, run_id, name, url, is_new=False)
+    # Persist the whole snapshot in one write transaction so SQLite syncs once per run, not per row.
+    with transaction(conn):
+        first_run = (get_games_count(cur) == 0)
+        run_id = create_run(cur, run_at, len(results))
+        last_id = 0 if first_run else get_max_game_id(cur)
+        upsert_games(cur, games_rows)
+
+        run_game_rows: List[Tuple[int, str, str, int]]
+        if first_run:
+            # nothing is flagged new on the first run, so there is no need to look the new Urls up
+            run_game_rows = [(run_id, name, slug_to_url(slug), 0) for name, slug, _, _ in games_rows]
         else:
-            insert_game(conn, name, url, run_at)
-            is_new_flag = False if first_run else True
-            insert_run_game(conn, run_id, name, url, is_new=is_new_flag)
-            if is_new_flag:
-                new_entries.append({"Name": name, "Url": url})
+            new_slugs = slugs_added_after(cur, last_id)
+            run_game_rows = []
+            for name, slug, _, _ in games_rows:
+                url = slug_to_url(slug)
+                # a Url repeated within one snapshot only counts as new the first time
+                is_new_flag = slug in new_slugs
+                new_slugs.discard(slug)
+                run_game_rows.append((run_id, name, url, 1 if is_new_flag else 0))
+                if is_new_flag:
+                    new_entries.append({"Name": name, "Url": url})
+        insert_run_games(cur, run_game_rows)
 
-    conn.commit()
     return first_run, new_entries
 
 
 # -------------------- JSON helpers (FitGirl-style output) -------------------- #
+def parse_json_games(data: bytes) -> List[Dict[str, str]]:
+    try:
+        games = orjson.loads(data) if orjson is not None else json.loads(data)
+    except Exception:
+        return []
+    return games if isinstance(games, list) else []
+
+
 def load_json_games(path: str) -> List[Dict[str, str]]:
     if os.path.exists(path):
-        with open(path, "r", encoding="utf-8") as f:
-            try:
-                return json.load(f)
-            except Exception:
-                return []
+        with open(path, "rb") as f:
+            return parse_json_games(f.read())
     return []
 
 
+def dump_json_games(games: List[Dict[str, str]]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(games, option=orjson.OPT_INDENT_2)
+    return json.dumps(games, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def write_json_games(games: List[Dict[str, str]], path: str) -> None:
+    with open(path, "wb") as f:
+        f.write(dump_json_games(games))
+
+
 def save_all_games_from_db(conn: sqlite3.Connection, path: str) -> None:
-    cur = conn.cursor()
-    cur.execute("SELECT Name, Url FROM games")
-    rows = cur.fetchall()
-    games = [{"Name": r["Name"], "Url": r["Url"]} for r in rows]
-    # sort by Name (case-insensitive) but keep original characters (so names like ".hack..." come first)
-    games_sorted = sorted(games, key=lambda g: (g["Name"] or "").lower())
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(games_sorted, f, ensure_ascii=False, indent=2)
-    print(f"Wrote {len(games_sorted)} games to {path}")
+    # sort by Name (case-insensitive) but keep original characters (so names like ".hack..." come first);
+    # idx_games_lname already holds this order, ties keep insertion order via id
+    cur = conn.execute("SELECT Name, slug FROM games ORDER BY lower(Name), id")
+    games = [{"Name": name, "Url": slug_to_url(slug)} for name, slug in cur]
+    write_json_games(games, path)
+    print(f"Wrote {len(games)} games to {path}")
 
 
 def save_new_games_file(new_entries: List[Dict[str, str]], path: str) -> None:
     if not new_entries:
         print("No new entries to write to", path)
         return
-    existing_new = load_json_games(path)
+    existing_data = b""
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            existing_data = f.read()
+    existing_new = parse_json_games(existing_data)
     existing_urls = {g["Url"] for g in existing_new}
     truly_new = [g for g in new_entries if g["Url"] not in existing_urls]
     if not truly_new:
         print("No truly new entries to prepend to", path)
         return
-    # Prepend newly discovered entries so newest appear first (like FitGirl sample expects newest items first)
-    combined = truly_new + existing_new
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(combined, f, ensure_ascii=False, indent=2)
+    # Prepend newly discovered entries so newest appear first (like FitGirl sample expects newest items first).
+    # When the file is in dump_json_games' own layout, only the new entries are serialized and the existing
+    # items are spliced in as-is; any other layout (compact, CRLF, hand-edited) is re-dumped whole.
+    existing_body = existing_data.strip()
+    if existing_body.startswith(b"[\n  {") and existing_body.endswith(b"}\n]"):
+        data = dump_json_games(truly_new)[:-2] + b",\n" + existing_body[2:]
+    else:
+        data = dump_json_games(truly_new + existing_new)
+    # write to a sibling temp file and swap it in, so an interrupted run never leaves a truncated file
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
     print(f"Wrote {len(truly_new)} new games to {path}")
 
 
 # -------------------- WebDriver helpers -------------------- #
+# Browser packages are imported only when a driver is actually needed; ensure_imports runs only if
+# that import fails, so warm runs skip the install checks entirely.
 def get_uc_driver():
-    import undetected_chromedriver as uc
+    # only undetected_chromedriver still imports distutils on modern Pythons; the shim must be in place first
+    ensure_distutils_shim()
+    try:
+        import undetected_chromedriver as uc
+    except ImportError:
+        ensure_imports({"undetected_chromedriver": PACKAGE_MAP["undetected_chromedriver"]})
+        import undetected_chromedriver as uc
     opts = uc.ChromeOptions()
     # Enable headless mode in CI environments
     if os.environ.get("CI"):
@@ -443,22 +660,34 @@ def get_uc_driver():
 
 
 def get_selenium_driver():
-    from selenium import webdriver
+    try:
+        from selenium import webdriver
+        from webdriver_manager.chrome import ChromeDriverManager
+    except ImportError:
+        ensure_imports({name: PACKAGE_MAP[name] for name in ("selenium", "webdriver_manager")})
+        from selenium import webdriver
+        from webdriver_manager.chrome import ChromeDriverManager
     from selenium.webdriver.chrome.service import Service
     from selenium.webdriver.chrome.options import Options
-    from webdriver_manager.chrome import ChromeDriverManager
 
+    # keep the downloaded chromedriver next to the script so later runs skip the lookup/download
+    os.environ.setdefault("WDM_LOCAL", "1")
     chrome_opts = Options()
-    # Enable headless mode in CI environments
-    if os.environ.get("CI"):
-        chrome_opts.add_argument("--headless=new")
-        chrome_opts.add_argument("--no-sandbox")
-        chrome_opts.add_argument("--disable-dev-shm-usage")
+    debugger_address = os.environ.get(CHROME_DEBUGGER_ENV)
+    if debugger_address:
+        # attaching to an existing browser: chromedriver rejects launch-only options here
+        chrome_opts.add_experimental_option("debuggerAddress", debugger_address)
     else:
-        chrome_opts.add_argument("--start-maximized")
-    chrome_opts.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_opts.add_experimental_option("useAutomationExtension", False)
-    chrome_opts.add_argument("--disable-blink-features=AutomationControlled")
+        # Enable headless mode in CI environments
+        if os.environ.get("CI"):
+            chrome_opts.add_argument("--headless=new")
+            chrome_opts.add_argument("--no-sandbox")
+            chrome_opts.add_argument("--disable-dev-shm-usage")
+        else:
+            chrome_opts.add_argument("--start-maximized")
+        chrome_opts.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_opts.add_experimental_option("useAutomationExtension", False)
+        chrome_opts.add_argument("--disable-blink-features=AutomationControlled")
     service = Service(ChromeDriverManager().install())
     driver = webdriver.Chrome(service=service, options=chrome_opts)
     try:
@@ -471,8 +700,85 @@ def get_selenium_driver():
     return driver
 
 
+def start_driver():
+    if os.environ.get(CHROME_DEBUGGER_ENV):
+        print(f"Attaching to running Chrome at {os.environ[CHROME_DEBUGGER_ENV]}...")
+        return get_selenium_driver()
+    # try undetected_chromedriver first
+    try:
+        print("Trying undetected-chromedriver...")
+        return get_uc_driver()
+    except Exception:
+        print("undetected-chromedriver failed; falling back to selenium. Traceback:")
+        traceback.print_exc()
+        return get_selenium_driver()
+
+
 # -------------------- main -------------------- #
-def main() -> None:
+def scrape_games(driver=None):
+    """
+    Scrape the list page: plain HTTP first, a browser only when the page can't be read directly.
+    A driver passed in is reused; otherwise one is started on demand. Returns (results, driver).
+    """
+    print("Scraping", URL)
+    results = scrape_http(URL)
+    if results:
+        return results, driver
+    print("Direct fetch found no games; falling back to a browser.")
+    if driver is None:
+        driver = start_driver()
+    return scrape(driver), driver
+
+
+def persist_snapshot(conn: sqlite3.Connection, results: List[Dict[str, str]]) -> None:
+    if not results:
+        print("No matching anchors found. You may need to increase wait time or the page structure changed.")
+        create_run(conn, datetime.now(timezone.utc).isoformat(), 0)
+        print("Created an empty run record in the database.")
+        return
+
+    first_run, new_entries = run_persist(conn, results)
+
+    # JSON behavior like FitGirl:
+    if first_run:
+        print("First run detected. Writing All.Games.json from DB and NOT creating New.Games.json.")
+        save_all_games_from_db(conn, JSON_ALL_PATH)
+    else:
+        if new_entries:
+            print(f"Found {len(new_entries)} new entries this run. Updating All.Games.json and New.Games.json.")
+            save_all_games_from_db(conn, JSON_ALL_PATH)
+            save_new_games_file(new_entries, JSON_NEW_PATH)
+        else:
+            print("No new games found this run.")
+
+
+def positive_minutes(value: str) -> float:
+    """argparse type for --interval: a finite number of minutes greater than zero."""
+    try:
+        minutes = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number of minutes: {value!r}")
+    # also rejects nan and inf, which time.sleep cannot take either
+    if not 0 < minutes < float("inf"):
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value!r}")
+    return minutes
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Scrape the SteamRip games list into SQLite and JSON.")
+    parser.add_argument(
+        "--daemon", action="store_true",
+        help="keep running and re-scrape on a timer, reusing one browser session",
+    )
+    parser.add_argument(
+        "--interval", type=positive_minutes, default=DEFAULT_DAEMON_INTERVAL_MINUTES, metavar="MINUTES",
+        help=f"minutes between scrapes in daemon mode (default: {DEFAULT_DAEMON_INTERVAL_MINUTES})",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
     driver = None
     conn: Optional[sqlite3.Connection] = None
     db_path_used: Optional[str] = None
@@ -484,69 +790,43 @@ def main() -> None:
             mark_first_run_complete()
         else:
             print("First run tasks are already completed. Proceeding to scrape site.")
-        
-        # Ensure dependencies and distutils shim
-        ensure_imports(PACKAGE_MAP)
-        ensure_distutils_shim()
-
-        # Start driver (try undetected_chromedriver first)
-        try:
-            print("Trying undetected-chromedriver...")
-            driver = get_uc_driver()
-        except Exception:
-            print("undetected-chromedriver failed; falling back to selenium. Traceback:")
-            traceback.print_exc()
-            try:
-                importlib.import_module("webdriver_manager")
-            except Exception:
-                try:
-                    run_pip_install(["webdriver-manager"])
-                except Exception:
-                    pass
-            driver = get_selenium_driver()
-
-        # Scrape
-        print("Scraping", URL)
-        results = scrape(driver)
 
         # Connect DB (script dir preferred; fallback to home)
         try:
-            conn = connect_db(default_db_path(DB_FILENAME))
-            db_path_used = default_db_path(DB_FILENAME)
+            conn = connect_db(DB_PATH)
+            db_path_used = DB_PATH
         except Exception:
-            conn = connect_db(fallback_db_path(DB_FILENAME))
-            db_path_used = fallback_db_path(DB_FILENAME)
+            conn = connect_db(FALLBACK_DB_PATH)
+            db_path_used = FALLBACK_DB_PATH
         print("Using DB at:", db_path_used)
 
-        # Persist results
-        if not results:
-            print("No matching anchors found. You may need to increase wait time or the page structure changed.")
-            create_run(conn, datetime.now(timezone.utc).isoformat(), 0)
-            conn.commit()
-            print("Created an empty run record in the database.")
-            print("\nRun completed (empty snapshot).")
-            if not os.environ.get("CI"):
-                input("Done. Press Enter to quit and close the browser...")
-            return
-
-        first_run, new_entries = run_persist(conn, results)
-
-        # JSON behavior like FitGirl:
-        if first_run:
-            print("First run detected. Writing All.Games.json from DB and NOT creating New.Games.json.")
-            save_all_games_from_db(conn, os.path.join(SCRIPT_DIR, JSON_ALL))
-        else:
-            if new_entries:
-                print(f"Found {len(new_entries)} new entries this run. Updating All.Games.json and New.Games.json.")
-                save_all_games_from_db(conn, os.path.join(SCRIPT_DIR, JSON_ALL))
-                save_new_games_file(new_entries, os.path.join(SCRIPT_DIR, JSON_NEW))
-            else:
-                print("No new games found this run.")
-
-        print("\nRun completed normally.")
+        if args.daemon:
+            print(f"Daemon mode: scraping every {args.interval:g} minutes. Press Ctrl+C to stop.")
+            while True:
+                try:
+                    results, driver = scrape_games(driver)
+                    persist_snapshot(conn, results)
+                except Exception:
+                    print("\nScrape failed; restarting the browser and retrying next interval:")
+                    traceback.print_exc()
+                    try:
+                        if driver:
+                            driver.quit()
+                    except Exception:
+                        pass
+                    driver = None
+                time.sleep(args.interval * 60)
+
+        results, driver = scrape_games()
+        persist_snapshot(conn, results)
+
+        print("\nRun completed (empty snapshot)." if not results else "\nRun completed normally.")
         if not os.environ.get("CI"):
             input("Done. Press Enter to quit and close the browser...")
 
+    except KeyboardInterrupt:
+        print("\nStopped.")
+
     except Exception:
         print("\nAn unhandled exception occurred:")
         traceback.print_exc()
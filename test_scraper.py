@@ -11,6 +11,9 @@ import sqlite3
 import json
 import tempfile
 import shutil
+import importlib.util
+import contextlib
+import io
 
 # Import the scraper functions
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -34,6 +37,11 @@ def test_clean_name():
     # Test whitespace normalization
     assert scraper.clean_name("  Game   Name  ") == "Game Name"
     
+    # Test combined suffixes in either order
+    assert scraper.clean_name("Game Name (2021) Free Download") == "Game Name"
+    assert scraper.clean_name("Game Name Free Download (v1.2)") == "Game Name"
+    assert scraper.clean_name("Game (Deluxe) (2021) Free Download") == "Game"
+    
     print("✓ clean_name tests passed")
 
 
@@ -62,10 +70,79 @@ def test_extract_games_from_html():
         assert game["Name"] != ""
         assert game["Url"] != ""
     
+    # Relative and absolute links to the same game collapse into the first entry;
+    # off-site links are ignored just like on the browser path
+    duplicate_html = """
+    <a href="/game1-free-download/">Game One</a>
+    <a href="https://steamrip.com/game1-free-download">Game One Again</a>
+    <a href="/game2-free-download/"></a>
+    <a href="https://othersite.net/spam-free-download">Spam</a>
+    <a href="/GAME3-FREE-DOWNLOAD">Wrong Case</a>
+    """
+    deduped = scraper.extract_games_from_html(duplicate_html)
+    assert deduped == [
+        {"Name": "Game One", "Url": "https://steamrip.com/game1-free-download"},
+        {"Name": "game2", "Url": "https://steamrip.com/game2-free-download"},
+    ], deduped
+    
     print(f"✓ Extracted {len(games)} games from HTML")
     print(f"  Sample: {games[0]}")
 
 
+def test_anchor_parsers():
+    """Test each HTML parser branch decodes entities exactly once"""
+    print("Testing anchor parser branches...")
+    
+    # relative and absolute on-site links are both kept, as on the browser path; off-site ones are not
+    sample_html = (
+        '<html><body><a href="/game1-free-download">Game &amp;amp; One</a>'
+        '<a href="https://steamrip.com/sidebar-game-free-download/">Sidebar Game</a>'
+        '<a href="https://othersite.net/spam-free-download">Spam</a></body></html>'
+    )
+    expected = [
+        {"Name": "Game &amp; One", "Url": "https://steamrip.com/game1-free-download"},
+        {"Name": "Sidebar Game", "Url": "https://steamrip.com/sidebar-game-free-download"},
+    ]
+    
+    parsers = [
+        ("selectolax", scraper.anchor_pairs_selectolax),
+        ("lxml", scraper.anchor_pairs_lxml),
+        (None, scraper.anchor_pairs_regex),
+    ]
+    for package, parse in parsers:
+        if package and importlib.util.find_spec(package) is None:
+            print(f"  skipped {parse.__name__}: {package} not installed")
+            continue
+        games = scraper.collect_games(parse(sample_html))
+        assert games == expected, f"{parse.__name__}: {games}"
+        print(f"  {parse.__name__} ok")
+    
+    print("✓ Anchor parser tests passed")
+
+
+def test_scrape_http():
+    """Test the browser-less fetch path against a local file"""
+    print("Testing scrape_http function...")
+    
+    test_dir = tempfile.mkdtemp()
+    
+    try:
+        page_path = os.path.join(test_dir, "list.html")
+        with open(page_path, 'w', encoding='utf-8') as f:
+            f.write('<a href="/game1-free-download/">Game One Free Download</a>')
+        
+        games = scraper.scrape_http("file://" + page_path)
+        assert games == [{"Name": "Game One", "Url": "https://steamrip.com/game1-free-download"}], games
+        
+        # Unreachable pages return no games so the caller can fall back to a browser
+        assert scraper.scrape_http("file://" + os.path.join(test_dir, "missing.html")) == []
+        
+        print("✓ scrape_http tests passed")
+        
+    finally:
+        shutil.rmtree(test_dir)
+
+
 def test_database_operations():
     """Test database operations"""
     print("Testing database operations...")
@@ -121,6 +198,11 @@ def test_database_operations():
         games_count = scraper.get_games_count(conn)
         assert games_count == 3, f"Expected 3 games, got {games_count}"
         
+        # Verify the per-run history only flags the new game
+        cursor.execute("SELECT Url FROM run_games WHERE is_new = 1")
+        flagged = [row[0] for row in cursor.fetchall()]
+        assert flagged == ["https://example.com/game3"], f"Unexpected new flags: {flagged}"
+        
         conn.close()
         
         print("✓ Database operations tests passed")
@@ -130,6 +212,65 @@ def test_database_operations():
         shutil.rmtree(test_dir)
 
 
+def test_slug_migration():
+    """Test that a games table from the old Url schema is migrated to slugs"""
+    print("Testing games table slug migration...")
+    
+    test_dir = tempfile.mkdtemp()
+    
+    try:
+        db_path = os.path.join(test_dir, "test_games.db")
+        all_games_path = os.path.join(test_dir, "All.Games.json")
+        
+        # Create a database with the previous schema
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+        CREATE TABLE games (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            Name TEXT,
+            Url TEXT UNIQUE,
+            first_seen TEXT,
+            last_seen TEXT
+        )""")
+        conn.execute(
+            "INSERT INTO games(Name, Url, first_seen, last_seen) VALUES (?, ?, ?, ?)",
+            ("Old Game", "https://steamrip.com/old-game-free-download", "2024-01-01", "2024-01-01"),
+        )
+        conn.execute(
+            "INSERT INTO games(Name, Url, first_seen, last_seen) VALUES (?, ?, ?, ?)",
+            ("Other Site", "https://example.com/other", "2024-01-01", "2024-01-01"),
+        )
+        conn.commit()
+        
+        conn.row_factory = sqlite3.Row
+        scraper.init_db(conn)
+        
+        slugs = sorted(row[0] for row in conn.execute("SELECT slug FROM games"))
+        assert slugs == ["https://example.com/other", "old-game-free-download"], slugs
+        
+        # Already-known games stay known after the migration
+        first_run, new_entries = scraper.run_persist(conn, [
+            {"Name": "Old Game", "Url": "https://steamrip.com/old-game-free-download/"},
+            {"Name": "New Game", "Url": "https://steamrip.com/new-game-free-download"},
+        ])
+        assert first_run is False
+        assert new_entries == [{"Name": "New Game", "Url": "https://steamrip.com/new-game-free-download"}], new_entries
+        
+        # JSON output still carries full Urls
+        scraper.save_all_games_from_db(conn, all_games_path)
+        with open(all_games_path, 'r') as f:
+            all_games = json.load(f)
+        assert all_games[0] == {"Name": "New Game", "Url": "https://steamrip.com/new-game-free-download"}
+        assert all_games[2] == {"Name": "Other Site", "Url": "https://example.com/other"}
+        
+        conn.close()
+        
+        print("✓ Slug migration tests passed")
+        
+    finally:
+        shutil.rmtree(test_dir)
+
+
 def test_json_operations():
     """Test JSON file operations"""
     print("Testing JSON operations...")
@@ -180,6 +321,33 @@ def test_json_operations():
         assert len(new_games) == 1
         assert new_games[0]["Name"] == "New Game"
         
+        # Later runs prepend, and entries already in the file are not repeated
+        newer_entries = [
+            {"Name": "Newer Game", "Url": "https://example.com/newer"},
+            {"Name": "New Game", "Url": "https://example.com/new"},
+        ]
+        scraper.save_new_games_file(newer_entries, new_games_path)
+        
+        with open(new_games_path, 'r') as f:
+            new_games = json.load(f)
+        
+        assert [g["Name"] for g in new_games] == ["Newer Game", "New Game"]
+        # A spliced file has the same bytes as dumping the whole list
+        with open(new_games_path, 'rb') as f:
+            assert f.read() == scraper.dump_json_games(new_games)
+
+        # Files in another layout (compact, CRLF) are re-dumped rather than spliced
+        for old_body in (b'[{"Name":"Old Game","Url":"https://example.com/old"}]',
+                         b'[\r\n  {\r\n    "Name": "Old Game",\r\n    "Url": "https://example.com/old"\r\n  }\r\n]'):
+            with open(new_games_path, 'wb') as f:
+                f.write(old_body)
+            scraper.save_new_games_file(new_entries, new_games_path)
+            with open(new_games_path, 'rb') as f:
+                assert f.read() == scraper.dump_json_games([
+                    {"Name": "New Game", "Url": "https://example.com/new"},
+                    {"Name": "Old Game", "Url": "https://example.com/old"},
+                ])
+
         conn.close()
         
         print("✓ JSON operations tests passed")
@@ -188,6 +356,30 @@ def test_json_operations():
         shutil.rmtree(test_dir)
 
 
+def test_parse_args():
+    """Test command line parsing"""
+    print("Testing argument parsing...")
+    
+    args = scraper.parse_args([])
+    assert not args.daemon
+    assert args.interval == scraper.DEFAULT_DAEMON_INTERVAL_MINUTES
+    
+    args = scraper.parse_args(["--daemon", "--interval", "0.5"])
+    assert args.daemon and args.interval == 0.5
+    
+    # Intervals time.sleep cannot honour are rejected up front instead of killing the daemon later
+    for bad in ("0", "-5", "nan", "inf", "abc"):
+        try:
+            with contextlib.redirect_stderr(io.StringIO()):
+                scraper.parse_args(["--interval", bad])
+        except SystemExit as e:
+            assert e.code == 2, bad
+        else:
+            raise AssertionError(f"--interval {bad} should be rejected")
+    
+    print("✓ Argument parsing tests passed")
+
+
 def main():
     """Run all tests"""
     print("=" * 60)
@@ -202,12 +394,24 @@ def main():
         test_extract_games_from_html()
         print()
         
+        test_anchor_parsers()
+        print()
+        
+        test_scrape_http()
+        print()
+        
         test_database_operations()
         print()
         
+        test_slug_migration()
+        print()
+        
         test_json_operations()
         print()
         
+        test_parse_args()
+        print()
+        
         print("=" * 60)
         print("All tests passed! ✓")
         print("=" * 60)